@@ -192,7 +192,9 @@ class TrafficMeasurementStation:
         _density = self.agg.data["density"].to_numpy().T
         _flow = self.agg.data["flow"].to_numpy().T
         _speed = self.agg.data["period_speed"].to_numpy().T
-        _data_array = (np.stack([_density, _flow, _speed], axis=0)).T
+        # column_stack builds the (n, 3) array directly - no (3, n)
+        # intermediate plus transpose view
+        _data_array = np.column_stack((_density, _flow, _speed))
         _data_array = _data_array[np.argsort(_data_array[:, 0])].T
         self.agg._density = _data_array[0]
         self.agg._flow = _data_array[1]
@@ -232,7 +234,9 @@ class TrafficMeasurementStation:
         _density = self.bag.data["centroid_density"].to_numpy().T
         _flow = self.bag.data["centroid_flow"].to_numpy().T
         _weight = self.bag.data["weight"].to_numpy().T
-        _data_array = (np.stack([_density, _flow, _weight], axis=0)).T
+        # column_stack builds the (n, 3) array directly - no (3, n)
+        # intermediate plus transpose view
+        _data_array = np.column_stack((_density, _flow, _weight))
         _data_array = _data_array[np.argsort(_data_array[:, 0])].T
         self.bag._density = _data_array[0]
         self.bag._flow = _data_array[1]
@@ -154,6 +154,9 @@ class AggregatedData:
             [self.quantiles.append(x) for x in quantiles if x not in self.quantiles]
             self.quantiles.sort()
 
+            # The previous quantile's solution seeds the next solve -
+            # neighbouring quantiles have nearby optima
+            previous = None
             for q in quantiles:
                 if penalty is not None:
                     model = models._pcqr(
@@ -163,7 +166,9 @@ class AggregatedData:
                         penalty=penalty,
                         eta=eta,
                         email=email,
+                        warm_start=previous,
                     )
+                    previous = model
                 else:
                     model = models._cqr(
                         x=self._density, y=self._flow, quantile=q, email=email
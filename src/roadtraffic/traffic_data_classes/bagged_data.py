@@ -85,6 +85,9 @@ class BaggedData:
             [self.quantiles.append(x) for x in quantiles if x not in self.quantiles]
             self.quantiles.sort()
 
+            # The previous quantile's solution seeds the next solve -
+            # neighbouring quantiles have nearby optima
+            previous = None
             for q in quantiles:
                 if penalty is not None:
                     model = models._pwcqr(
@@ -95,7 +98,9 @@ class BaggedData:
                         penalty=penalty,
                         eta=eta,
                         email=email,
+                        warm_start=previous,
                     )
+                    previous = model
                 else:
                     model = models._wcqr(
                         x=self._density, y=self._flow, weight=self._weight, quantile=q, email=email
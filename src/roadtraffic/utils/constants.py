@@ -1,7 +1,7 @@
 from typing import Union, Any
 
 URL_FINTRAFFIC: str = (
-    "https://tie.digitraffic.fi/api/tms/v1/history/raw/lamraw_TMS_YY_DD.csv"
+    "https://tie.digitraffic.fi/api/tms/v1/history/raw/lamraw_{tms}_{yy}_{dd}.csv"
 )
 """
 URL to access raw data from traffic measurement stations, \
@@ -34,6 +34,28 @@ DEF_COL_NAMES_FINTRAFFIC: list[Union[str, Any]] = [
 Standardized column names for files containing traffic data from Finland.
 """
 
+DEF_DTYPES_FINTRAFFIC: dict[str, str] = {
+    "id": "int32",
+    "year": "int16",
+    "day": "int16",
+    "hour": "int8",
+    "minute": "int8",
+    "second": "int8",
+    "hund_second": "int8",
+    "lane": "int8",
+    "direction": "int8",
+    "vehicle": "int8",
+    "speed": "float32",
+    "faulty": "int8",
+    "total_time": "int32",
+}
+"""
+Compact dtypes for the standardized traffic data columns. \
+`pd.read_csv` defaults every integer column to int64; narrowing the \
+dtypes cuts the memory footprint of a daily file roughly fourfold and \
+speeds up every subsequent column scan.
+"""
+
 DEF_AGG_TIME_PER: int = 5
 """
 Default aggregation time period.
@@ -44,15 +66,23 @@ DEF_TAU_LIST: list[float] = [0.5]
 Default list of quantiles to be estimated.
 """
 
-DEF_FILENAME: str = "lamraw_TMS_YY_DD_bz2.pkl"
+DEF_FILENAME: str = "lamraw_{tms}_{yy}_{dd}_bz2.pkl"
 """
 Default filename to load processed traffic data from local file. \
 Processing is done with :func:`~roadtraffic.utils.load.read_report`
 """
 
-DEF_FILENAME_U: str = "lamraw_TMS_YY_DD_bz2_u.pkl"
+DEF_FILENAME_U: str = "lamraw_{tms}_{yy}_{dd}_zstd_u.pkl"
+"""
+Default filename to load raw data from local file. \
+Files are zstd-compressed pickles: zstd decompresses an order of \
+magnitude faster than the bz2 compression used previously.
+"""
+
+DEF_FILENAME_U_BZ2: str = "lamraw_{tms}_{yy}_{dd}_bz2_u.pkl"
 """
-Default filename to load raw data from local file.
+Legacy filename of bz2-compressed raw data files, still readable \
+for local caches saved by older versions of the package.
 """
 
 DEF_NUM_BAGS_DENSITY: int = 70
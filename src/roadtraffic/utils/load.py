@@ -1,21 +1,151 @@
 # import dependencies
-import datetime
+import collections
+import concurrent.futures
+import functools
+import io
 import os
 import pathlib
 import time
 import typing
 import warnings
 
+import numpy as np
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
+from urllib3.util import Retry
 
 from .constants import (
     DEF_COL_NAMES_FINTRAFFIC,
+    DEF_DTYPES_FINTRAFFIC,
     URL_FINTRAFFIC,
     DEF_FILENAME_U,
+    DEF_FILENAME_U_BZ2,
 )
 
+try:  # numba is an optional accelerator - everything falls back to NumPy
+    import numba
+except ImportError:
+    numba = None
+
+# Below this row count the JIT dispatch overhead outweighs the fused pass
+_NUMBA_MIN_ROWS = 100_000
+
+if numba is not None:
+
+    @numba.njit(cache=True, parallel=True)
+    def _classify_vehicles(vehicle, counts):  # pragma: no cover - jitted
+        """Fill cars/buses/trucks flags in one fused pass over `vehicle`."""
+        for i in numba.prange(vehicle.shape[0]):
+            v = vehicle[i]
+            counts[i, 0] = 1 if v == 1 else 0
+            counts[i, 1] = 1 if v == 3 else 0
+            counts[i, 2] = 1 if v == 2 or 4 <= v <= 7 else 0
+
+
+# Process-level cache of downloaded report bodies, keyed by URL. Days that
+# returned 404 are negative-cached as None, so batch retries and repeated
+# runs within one process skip the network round-trip entirely.
+_URL_CACHE_SIZE = 32
+_CACHE_MISS = object()
+_url_cache: "collections.OrderedDict[str, typing.Optional[bytes]]" = (
+    collections.OrderedDict()
+)
+
+
+def _remember_url(url: str, content: typing.Optional[bytes]) -> None:
+    """Store a fetch result, evicting the least recently used entry."""
+    _url_cache[url] = content
+    _url_cache.move_to_end(url)
+    while len(_url_cache) > _URL_CACHE_SIZE:
+        _url_cache.popitem(last=False)
+
+
+def _fetch_report(url: str, http) -> typing.Optional[bytes]:
+    """Fetch a raw report body, consulting the URL cache first.
+
+    Returns the response body, or None if the file does not exist or the
+    server stayed overloaded. 429 results are not cached, so a later
+    attempt can still succeed.
+    """
+    cached = _url_cache.get(url, _CACHE_MISS)
+    if cached is not _CACHE_MISS:
+        if cached is None:
+            message = f"[LOG] Warning: file at {url} does not exist. Try to select another day. An empty pd.DataFrame will be returned."  # noqa E501
+            warnings.warn(message=message)
+        return cached
+
+    # Scope each response in a `with` block so the underlying connection is
+    # released as soon as the body has been read - no Response object (and
+    # no duplicate raw buffer) outlives this function
+    with http.get(url, timeout=30) as r:
+        status_code = r.status_code
+        retry_after = r.headers.get("Retry-After", "")
+        content = r.content if status_code not in (404, 429) else None
+
+    # Check that there is no connection limit. Pooled sessions already retry
+    # 429s with backoff at the adapter level; this fallback honors the
+    # server's Retry-After header instead of a hard-coded 60-second wait.
+    if status_code == 429:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            delay = 5.0
+        print(
+            f"[LOG] Too many requests, waiting {delay:.0f} seconds to connect again",
+            end="\x1b[1K\r",
+            flush=True,
+        )
+        time.sleep(delay)
+        with http.get(url, timeout=30) as r:
+            status_code = r.status_code
+            content = r.content if status_code not in (404, 429) else None
+
+    if status_code == 429:
+        message = "[LOG] The server is overloaded. Please, try to load the data later. An empty pd.DataFrame will be returned"  # noqa E501
+        warnings.warn(message=message)
+        return None
+    if status_code == 404:
+        _remember_url(url, None)
+        message = f"[LOG] Warning: file at {url} does not exist. Try to select another day. An empty pd.DataFrame will be returned."  # noqa E501
+        warnings.warn(message=message)
+        return None
+
+    _remember_url(url, content)
+    return content
+
+
+@functools.lru_cache(maxsize=64)
+def _load_pickle_cached(
+    abs_path: str, mtime: float, compression: str
+) -> pd.DataFrame:
+    """Decompress and unpickle a cached day file, memoized on (path, mtime).
+
+    The mtime key invalidates the entry when the file is rewritten. Call
+    ``_load_pickle_cached.cache_clear()`` to drop the held references.
+    """
+    return pd.read_pickle(abs_path, compression=compression)
+
+
+def _read_pickle(path: pathlib.Path, compression: str) -> pd.DataFrame:
+    """Read a local cache file through the memoized loader.
+
+    Returns a copy so callers cannot mutate the cached frame.
+    """
+    resolved = path.resolve()
+    return _load_pickle_cached(
+        str(resolved), resolved.stat().st_mtime, compression
+    ).copy()
+
+
+def _downcast_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Narrow the standard integer/float columns to their compact dtypes."""
+    for column, dtype in DEF_DTYPES_FINTRAFFIC.items():
+        if column in df:
+            df[column] = df[column].astype(dtype, copy=False)
+    return df
+
 
 # Download the .csv report of `tms_id` station for the day `day_of_year`
 def read_raw_report(
@@ -26,13 +156,14 @@ def read_raw_report(
     save: bool = False,
     save_path: typing.Optional[str] = None,
     sort_total_time: bool = True,
+    session: typing.Optional[requests.Session] = None,
 ) -> pd.DataFrame:
     """
     Download the raw data from Fintraffic for the `tms_id` station for the `day` of the `year`. \
     By default the data is cleaned - faulty observations are deleted. \
     The type of vehicle is determined based on the classification from Fintraffic.
 
-    | It is possible to save a `.pkl` file, setting `save` to True. The default filename format "lamraw_TMS_YY_DD_bz2.pkl" is used. 
+    | It is possible to save a `.pkl` file, setting `save` to True. The default filename format "lamraw_TMS_YY_DD_zstd.pkl" is used. 
     | It is possible to locally read a `.pkl` file locally, specifying a `path_name`. \
         At first, the search for the processed files is done. \
         If it is not found, then the unprocessed file is looked up. \
@@ -52,15 +183,19 @@ def read_raw_report(
         365 (366 in leap year) - December 31st. \
         To caclulate the day of the year from a date you can use `roadtraffic.utils.funcs.date_to_day()` function.
     save : bool, optional
-        If specified, saves loaded data in the .pkl file format with bz2-compression with the default filename format "lamraw_TMS_YY_DD_bz2_u.pkl", by default False
+        If specified, saves loaded data in the .pkl file format with zstd-compression with the default filename format "lamraw_TMS_YY_DD_zstd_u.pkl", by default False
     load_path : str, optional
-        If specified, reads data from the `path_name` folder from a locally saved bz2-compressed .pkl file. \
-        Unprocessed "lamraw_TMS_YY_DD_bz2_u.pkl" files can be read, by default None
+        If specified, reads data from the `path_name` folder from a locally saved compressed .pkl file. \
+        Unprocessed "lamraw_TMS_YY_DD_zstd_u.pkl" files are looked up first, then legacy \
+        bz2-compressed "lamraw_TMS_YY_DD_bz2_u.pkl" ones, by default None
     save_path : str, optional
-        If specified, saves loaded data in the `save_path` folder in the .pkl file format with bz2-compression with \
-        the default filename format "lamraw_TMS_YY_DD_bz2_u.pkl", by default None
+        If specified, saves loaded data in the `save_path` folder in the .pkl file format with zstd-compression with \
+        the default filename format "lamraw_TMS_YY_DD_zstd_u.pkl", by default None
     sort_total_time : bool, optional
         If specified, sorts the data by the `total_time` column, by default True
+    session : requests.Session, optional
+        A `requests.Session` to reuse the TCP/TLS connection across many downloads. \
+        If not specified, a plain one-off request is made, by default None
 
     Returns
     -------
@@ -69,60 +204,81 @@ def read_raw_report(
         
     Raises
     ------
-    AssertionError
-        The day is incorrect, it should be 1 < day < 366.
-    AssertionError
+    ValueError
+        The day is incorrect, it should be 1 <= day <= 366.
+    ValueError
         The data is available starting from year 1995 only.
 
     See Also
     --------
     :func:`roadtraffic.utils.funcs.date_to_day`
-        A function to convert a date into day of the year. 
+        A function to convert a date into day of the year.
     """  # noqa E501
-    # Initiate timer
-    # start_time = time.perf_counter()
+    _validate_year_day(year, day)
+    return _read_raw_report_unchecked(
+        tms_id,
+        year,
+        day,
+        load_path=load_path,
+        save=save,
+        save_path=save_path,
+        sort_total_time=sort_total_time,
+        session=session,
+    )
 
-    # Check assert errors
-    # fmt: off
-    assert 1 <= day <= 366, "[LOG] AssertionError: the day is incorrect, it should be 1 < day < 366"  # noqa
-    assert 1995 <= year, "[LOG] AssertionError: the data is available starting from year 1995 only "  # noqa
-    # fmt: on
 
-    # Create column names for the pd.DataFrame
-    column_names = DEF_COL_NAMES_FINTRAFFIC
+def _validate_year_day(year: int, day: int) -> None:
+    """Check the year/day bounds, raising ValueError on bad input."""
+    # ValueError instead of assert so the checks survive `python -O`
+    if not 1 <= day <= 366:
+        raise ValueError(
+            "[LOG] ValueError: the day is incorrect, it should be 1 <= day <= 366"
+        )
+    if year < 1995:
+        raise ValueError(
+            "[LOG] ValueError: the data is available starting from year 1995 only"
+        )
 
-    # Initiate an empty pd.DataFrame
-    df = pd.DataFrame()
 
-    # Create the actual filename for processed data
-    # file_name = DEF_FILENAME
+def _read_raw_report_unchecked(
+    tms_id: int,
+    year: int,
+    day: int,
+    load_path: typing.Optional[str] = None,
+    save: bool = False,
+    save_path: typing.Optional[str] = None,
+    sort_total_time: bool = True,
+    session: typing.Optional[requests.Session] = None,
+) -> pd.DataFrame:
+    """:func:`read_raw_report` without input validation, for batch callers
+    that have already validated the whole day list once."""
+    # Create column names for the pd.DataFrame
+    column_names = DEF_COL_NAMES_FINTRAFFIC
 
-    # file_name = (
-    #    file_name.replace("TMS", str(tms_id))
-    #    .replace("YY", str(year)[2:4])
-    #    .replace("DD", str(day))
-    # )
+    # None until data is actually loaded - cheaper and clearer than
+    # allocating an empty frame and probing df.empty
+    df: typing.Optional[pd.DataFrame] = None
 
     # Create the actual filename for unprocessed data
-    file_name_u = DEF_FILENAME_U
-
-    file_name_u = (
-        file_name_u.replace("TMS", str(tms_id))
-        .replace("YY", str(year)[2:4])
-        .replace("DD", str(day))
-    )
+    yy = str(year)[2:4]
+    file_name_u = DEF_FILENAME_U.format(tms=tms_id, yy=yy, dd=day)
 
     if load_path is not None:
-
-        file_path_u = load_path + "/" + file_name_u
-        file_path_u = pathlib.Path(file_path_u)
-
-        if os.path.isfile(file_path_u):
-            df = pd.read_pickle(file_path_u, compression="bz2")
-
-        if df.empty:
-            # Stop timer
-            # end_time = time.perf_counter()
+        # The cache probe comes first: a hit needs no URL formatting and a
+        # single stat per candidate file
+        base_path = pathlib.Path(load_path)
+        file_path_u = base_path / file_name_u
+        if file_path_u.is_file():
+            df = _read_pickle(file_path_u, compression="zstd")
+        else:
+            # Legacy cache saved by an older version of the package
+            file_path_u_bz2 = base_path / DEF_FILENAME_U_BZ2.format(
+                tms=tms_id, yy=yy, dd=day
+            )
+            if file_path_u_bz2.is_file():
+                df = _read_pickle(file_path_u_bz2, compression="bz2")
+
+        if df is None:
             message = f"[LOG] Warning: {file_name_u} is not found at {load_path}. An empty pd.DataFrame will be returned." # noqa E501
             warnings.warn(message=message)
             if save is True:
@@ -131,14 +287,9 @@ def read_raw_report(
                     # noqa E501
                 )
         else:
-
-            # Stop timer
-            # end_time = time.perf_counter()
-
-            # print(
-            #    f"File {file_name_u} is loaded. "
-            #    + f"Time spent: {end_time - start_time:.4f} sec."  # noqa E501
-            # )
+            # Files saved before the compact dtypes were introduced
+            # deserialize as int64/float64 - normalize them on load
+            df = _downcast_columns(df)
 
             # Save to .pkl if necessary
             if save is True:
@@ -146,87 +297,47 @@ def read_raw_report(
                     s_path = file_name_u
                 else:
                     s_path = os.path.join(save_path, file_name_u)
-                df.to_pickle(s_path, compression="bz2")
+                df.to_pickle(s_path, compression="zstd")
                 print(f"[LOG] Data is successfully saved to {s_path}")
 
     else:
-        # Assign URL path for data loading
-        url = URL_FINTRAFFIC
-
-        # Create the actual url
-        url = (
-            url.replace("TMS", str(tms_id))
-            .replace("YY", str(year)[2:4])
-            .replace("DD", str(day))
-        )
+        # Create the actual url for data loading
+        url = URL_FINTRAFFIC.format(tms=tms_id, yy=yy, dd=day)
 
         # Call the link to receive the response
-        r = requests.get(url)
-
-        # Try to download the file
-        if r.status_code != 404:
-            # Check that there is no connection limit
-            if r.status_code == 429:
-                for i in range(59, 0, -1):
-                    print(
-                        f"[LOG] Too many requests, waiting {i} seconds to connect again",
-                        end="\x1b[1K\r",
-                        flush=True,
-                    )
-                    time.sleep(1)
-                r = requests.get(url)
-            if r.status_code == 429:
-                message = "[LOG] The server is overloaded. Please, try to load the data later. An empty pd.DataFrame will be returned"  # noqa E501
-                warnings.warn(message=message)
-                return pd.DataFrame()
-            elif r.status_code == 404:
-                # Stop timer
-                # end_time = time.perf_counter()
-                # print(f"Time spent: {end_time - start_time:.4f} seconds")
-                message = f"[LOG] Warning: file at {url} does not exist. Try to select another day. An empty pd.DataFrame will be returned."  # noqa E501
-                warnings.warn(message=message)
-                if save is True:
-                    warnings.warn(
-                        "[LOG] Warning: It is impossible to save a file, as data was not loaded. Check warning above."
-                        # noqa E501
-                    )
-            else:
-                with open(file_name_u[:-4] + ".csv", "wb") as f:
-                    f.write(r.content)
-                df = pd.read_csv(
-                    file_name_u[:-4] + ".csv",
-                    delimiter=";",
-                    names=column_names,
-                )
-                os.remove(file_name_u[:-4] + ".csv")
-
-                # Stop timer
-                # end_time = time.perf_counter()
-                # print(
-                #    f"Download successful - file for the sensor {tms_id} for the day {day} in year {year} was loaded in {end_time - start_time:.4f} seconds"  # noqa E501
-                #)  # noqa E501
-
-                # Save to .pkl if necessary
-                if save is True:
-                    if save_path is None:
-                        s_path = file_name_u
-                    else:
-                        s_path = os.path.join(save_path, file_name_u)
-                    df.to_pickle(s_path, compression="bz2")
-                    print(f"[LOG] Data is successfully saved to {s_path}")
-        else:
-            # Stop timer
-            # end_time = time.perf_counter()
-            # print(f"Time spent: {end_time - start_time:.4f} seconds")
-            message = f"[LOG] Warning: file at {url} does not exist. Try to select another day. An empty pd.DataFrame will be returned."  # noqa E501
-            warnings.warn(message=message)
+        http = session if session is not None else requests
+        content = _fetch_report(url, http)
+
+        if content is None:
             if save is True:
                 warnings.warn(
                     "[LOG] Warning: It is impossible to save a file, as data was not loaded. Check warning above."
                     # noqa E501
                 )
+        else:
+            # Parse the response body in memory - writing a temporary
+            # .csv just to read it back is a wasted round-trip
+            df = pd.read_csv(
+                io.BytesIO(content),
+                delimiter=";",
+                names=column_names,
+                dtype=DEF_DTYPES_FINTRAFFIC,
+                engine="c",
+            )
 
-    if not df.empty and sort_total_time:
+            # Save to .pkl if necessary
+            if save is True:
+                if save_path is None:
+                    s_path = file_name_u
+                else:
+                    s_path = os.path.join(save_path, file_name_u)
+                df.to_pickle(s_path, compression="zstd")
+                print(f"[LOG] Data is successfully saved to {s_path}")
+
+    if df is None:
+        # Keep the public contract: callers always get a pd.DataFrame
+        return pd.DataFrame()
+    if sort_total_time:
         df.sort_values(by=["total_time"], inplace=True, ignore_index=True)
     return df
 
@@ -249,14 +360,15 @@ def read_many_reports(
     days_list: list
         A list of tuples to download the data for. A format for each day is (year, day of year).
     load_path:
-        If specified, reads data from the `path_name` folder from a locally saved bz2-compressed .pkl file. \
-        Unprocessed "lamraw_TMS_YY_DD_bz2_u.pkl" files can be read, by default None
+        If specified, reads data from the `path_name` folder from a locally saved compressed .pkl file. \
+        Unprocessed "lamraw_TMS_YY_DD_zstd_u.pkl" files are looked up first, then legacy \
+        bz2-compressed "lamraw_TMS_YY_DD_bz2_u.pkl" ones, by default None
     save: bool, optional
-        If specified, saves loaded data in the .pkl file format with bz2-compression with filename defined by
+        If specified, saves loaded data in the .pkl file format with zstd-compression with filename defined by
         `save_filename`, by default False
     save_path:
         If specified, saves data for each loaded day in the `save_path` folder in the .pkl file format with
-        bz2-compression with a standard filename "lamraw_TMS_YY_DD_bz2_u.pkl", by default None
+        zstd-compression with a standard filename "lamraw_TMS_YY_DD_zstd_u.pkl", by default None
     sort_total_time : bool, optional
         If specified, sorts the data for each day by the `total_time` column and resets index , by default True
 
@@ -265,36 +377,79 @@ def read_many_reports(
     pd.DataFrame
         A `pd.DataFrame` with the raw data.
     """
-    assert isinstance(days_list, list), "days_list must be a list."
-    assert all([isinstance(day, tuple) for day in days_list]), "[LOG] AssertionError: days_list must contain only tuples." # noqa E501
-    assert all([isinstance(day[0], int) for day in days_list]), "[LOG] AssertionError: days_list must contain only tuples of integers." # noqa E501
-    assert all([isinstance(day[1], int) for day in days_list]), "[LOG] AssertionError: days_list must contain only tuples of integers." # noqa E501
+    # Validate the whole batch once up front - the per-day reader is then
+    # called through its unchecked variant inside the loop
+    if not isinstance(days_list, list):
+        raise ValueError("[LOG] ValueError: days_list must be a list.")
+    if not all([isinstance(day, tuple) for day in days_list]):
+        raise ValueError("[LOG] ValueError: days_list must contain only tuples.")
+    if not all(
+        [isinstance(day[0], int) and isinstance(day[1], int) for day in days_list]
+    ):
+        raise ValueError(
+            "[LOG] ValueError: days_list must contain only tuples of integers."
+        )
+    for year, day in days_list:
+        _validate_year_day(year, day)
 
     # Initiate timer
     start_time = time.perf_counter()
     total_files = len(days_list)
     loaded_files = 0
 
-    # Initiate an empty pd.DataFrame
-    df_all = pd.DataFrame()
-
-    # Iterate over the list of days
-    for year, day in tqdm(days_list, desc="Loading files", unit="files"):
-        df = read_raw_report(
-            tms_id=tms_id,
-            year=year,
-            day=day,
-            load_path=load_path,
-            save=save,
-            save_path=save_path,
-            sort_total_time=sort_total_time,
+    frames: list[pd.DataFrame] = []
+
+    # Reuse one pooled connection for the whole batch - a fresh TCP/TLS
+    # handshake per day is the dominant cost of downloading many small files
+    with requests.Session() as session:
+        session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=16,
+                pool_maxsize=16,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.5,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                    # Hand the final response back instead of raising
+                    # RetryError - _fetch_report warns and skips the day,
+                    # so one bad day cannot sink the whole batch
+                    raise_on_status=False,
+                ),
+            ),
         )
-        if not df.empty:
-            if df_all.empty:
-                df_all = df
-            else:
-                df_all = pd.concat([df_all, df], ignore_index=True)
-            loaded_files += 1
+
+        def _load_one(year_day: tuple[int, int]) -> pd.DataFrame:
+            year, day = year_day
+            return _read_raw_report_unchecked(
+                tms_id=tms_id,
+                year=year,
+                day=day,
+                load_path=load_path,
+                save=save,
+                save_path=save_path,
+                sort_total_time=sort_total_time,
+                session=session,
+            )
+
+        # Downloads are latency-bound, so overlap them with a small thread
+        # pool; four workers keeps us under the Fintraffic rate limit
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            for df in tqdm(
+                executor.map(_load_one, days_list),
+                total=total_files,
+                desc="Loading files",
+                unit="files",
+            ):
+                if not df.empty:
+                    frames.append(df)
+                    loaded_files += 1
+
+    df_all = (
+        pd.concat(frames, ignore_index=True, copy=False)
+        if frames
+        else pd.DataFrame()
+    )
 
     # Stop timer
     end_time = time.perf_counter()
@@ -355,50 +510,81 @@ def process_data(
     pd.DataFrame
         A `pd.DataFrame` with the processed data. Index is reset.
     """
-    # DIRECTION
     if direction is not None:
         assert direction in [1, 2], "[LOG] AssertionError: direction must be 1 or 2."
-        df = df[df["direction"] == direction]
 
-    # LANES
     if lanes is not None:
         assert lanes is None or isinstance(lanes, list), "[LOG] AssertionError: lanes must be a list."
         assert lanes is None or all(
             [isinstance(lane, int) for lane in lanes]
         ), "[LOG] AssertionError: lanes must contain only integers."
 
-        df = df[df["lane"].isin(lanes)]
-
-    # HOUR_TO and HOUR_FROM
     assert (
         0 <= hour_from <= 23
     ), "[LOG] AssertionError: hour_from must be greater or equal to 0 but less or equal to 23."
     assert (
         hour_from <= hour_to < 24
     ), "[LOG] AssertionError: hour_to must be greater or equal to hour_from and less than 24."
-    df = df[(df["hour"] >= hour_from) & (df["hour"] <= hour_to)]
 
-    # IF_FAULTY
+    # Fuse all row filters into one boolean mask and slice once - each
+    # separate boolean-index pass copies every surviving column
+    hour = df["hour"].to_numpy()
+    mask = (hour >= hour_from) & (hour <= hour_to)
+    if direction is not None:
+        mask &= df["direction"].to_numpy() == direction
+    if lanes is not None:
+        mask &= df["lane"].isin(lanes).to_numpy()
     if delete_if_faulty:
-        df = df[df["faulty"] == 0]
+        mask &= df["faulty"].to_numpy() == 0
 
-    # Assign dates
+    df = df.loc[mask].reset_index(drop=True)
+
+    # New columns are assembled into preallocated arrays and attached with a single
+    # concat - per-column insertion triggers a block-manager reallocation each time
+    new_columns: list[typing.Union[pd.Series, pd.DataFrame]] = []
+
+    # Assign dates. Kept as a native datetime64 column - an object column of
+    # datetime.date instances costs ~28 bytes/row plus GC pressure and
+    # makes every date filter a Python-level loop
     if assign_date:
-        df["temp"] = df.year.astype("str") + "-" + df.day.astype("str")
-        df["date"] = df.temp.apply(
-            lambda x: datetime.date(int(x.split("-")[0]) + 2000, 1, 1)
-            + datetime.timedelta(int(x.split("-")[1]) - 1)
+        # Widen before the arithmetic - year/day are int16 after
+        # downcasting and 2023 * 1000 overflows the narrow dtype
+        dates = pd.to_datetime(
+            (df["year"].to_numpy(dtype=np.int64) + 2000) * 1000
+            + df["day"].to_numpy(dtype=np.int64),
+            format="%Y%j",
         )
-        df.drop(columns=['temp'], inplace=True)
+        new_columns.append(pd.Series(dates, name="date"))
 
     # Calculate the number of different vehicles
     if calculate_vehicles:
-        df["cars"] = df["vehicle"].apply(lambda x: 1 if x == 1 else 0)
-        df["buses"] = df["vehicle"].apply(lambda x: 1 if x == 3 else 0)
-        df["trucks"] = df["vehicle"].apply(
-            lambda x: 1 if x == 2 or x == 4 or x == 5 or x == 6 or x == 7 else 0
+        vehicle = df["vehicle"].to_numpy()
+        counts = np.empty((len(df), 3), dtype=np.int8)
+        if numba is not None and len(df) >= _NUMBA_MIN_ROWS:
+            # One fused parallel pass instead of four vectorized scans
+            _classify_vehicles(vehicle, counts)
+        else:
+            counts[:, 0] = vehicle == 1
+            counts[:, 1] = vehicle == 3
+            # An equality-OR chain beats np.isin at this small cardinality -
+            # no hash table, just vectorized comparisons
+            counts[:, 2] = (
+                (vehicle == 2)
+                | (vehicle == 4)
+                | (vehicle == 5)
+                | (vehicle == 6)
+                | (vehicle == 7)
+            )
+        new_columns.append(
+            pd.DataFrame(counts, columns=["cars", "buses", "trucks"])
         )
 
-    df.reset_index(drop=True, inplace=True)
+    if new_columns:
+        df = pd.concat([df] + new_columns, axis=1, copy=False)
+
+    # Raw data loaded outside read_raw_report may still carry int64/float64
+    # columns - normalize so the filter masks and groupbys downstream scan
+    # narrow columns
+    df = _downcast_columns(df)
 
     return df
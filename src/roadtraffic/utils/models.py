@@ -1,4 +1,7 @@
 # import dependencies
+import concurrent.futures
+import logging
+import os
 import typing
 import time
 from dataclasses import dataclass
@@ -9,6 +12,10 @@ from numpy.typing import ArrayLike
 from pystoned import CNLS, pCNLS, wCNLS, pwCNLS, CQER, pCQER, wCQER, pwCQER
 from pystoned.constant import RTS_VRS, FUN_PROD, CET_ADDI
 
+# %-style lazy formatting: messages are only built when a handler is
+# active, and batch sweeps no longer serialize on stdout flushes
+_log = logging.getLogger(__name__)
+
 
 @dataclass
 class ModelResults:
@@ -34,8 +41,42 @@ class ModelResults:
 
     def __init__(self):
         self._models = dict()
+        # Materialized arrays per model key - pystoned walks Pyomo variable
+        # objects on every get_*() call, so the first access stores the
+        # resulting np.ndarray here and later calls are dict lookups
+        self._cache: dict = {}
         pass
 
+    def _get(self, key: tuple):
+        """Return the model stored under `key` with a single dict lookup."""
+        try:
+            return self._models[key]
+        except KeyError:
+            raise AssertionError(
+                "Model with the specified parameters is not estimated."
+            ) from None
+
+    def _arrays(self, key: tuple) -> dict:
+        """Return the float64 snapshot of the data arrays for the model
+        `key`, materializing x, y, the frontier and the coefficients on
+        first access.
+
+        `model.x` / `model.y` are Python lists and `get_frontier()` walks
+        Pyomo variables, so every accessor that went through them paid an
+        O(n) Python iteration; the snapshot pays it once per model.
+        """
+        arrays = self._cache.setdefault(key, {})
+        if "x" not in arrays:
+            model = self._get(key)
+            arrays["x"] = np.asarray(model.x, dtype=np.float64).ravel()
+            arrays["y"] = np.asarray(model.y, dtype=np.float64).ravel()
+            arrays["frontier"] = np.asarray(
+                model.get_frontier(), dtype=np.float64
+            ).ravel()
+            arrays["alpha"] = np.asarray(model.get_alpha(), dtype=np.float64).ravel()
+            arrays["beta"] = np.asarray(model.get_beta(), dtype=np.float64).ravel()
+        return arrays
+
     def _add_model(
         self,
         model: typing.Union[
@@ -53,22 +94,28 @@ class ModelResults:
         eta: typing.Union[None, float],
     ):
         self._models[quantile, penalty, eta] = model
+        # Drop arrays cached for a previous model under the same key
+        self._cache.pop((quantile, penalty, eta), None)
         pass
 
+    @staticmethod
+    def _key(item) -> tuple:
+        """Normalize an index into the (quantile, penalty, eta) key tuple.
+
+        A bare quantile (`'mean'` or a float) selects the unpenalized model;
+        shorter tuples are padded with None.
+        """
+        if isinstance(item, tuple):
+            return item + (None,) * (3 - len(item))
+        return (item, None, None)
+
     def __getitem__(self, item):
-        if (item == "mean") or (0 < item < 1):
-            try:
-                return self._models[item, None, None]
-            except KeyError:
-                raise KeyError("Model with the specified parameters was not estimated.")
-        elif (type(item) is tuple) and (len(item) == 3):
-            try:
-                return self._models[item]
-            except KeyError:
-                raise KeyError("Model with the specified parameters was not estimated.")
-        else:
-            raise KeyError("Model with the specified parameters was not estimated.")
-        pass
+        try:
+            return self._models[self._key(item)]
+        except (KeyError, TypeError):
+            raise KeyError(
+                "Model with the specified parameters was not estimated."
+            ) from None
 
     def get_models(self):
         """
@@ -104,14 +151,7 @@ class ModelResults:
         ArrayLike
             Array with the estimated function values.
         """
-        assert (
-            quantile,
-            penalty,
-            eta,
-        ) in self._models.keys(), (
-            "Model with the specified parameters is not estimated."
-        )
-        return self._models[quantile, penalty, eta].get_frontier()
+        return self._arrays((quantile, penalty, eta))["frontier"]
 
     def get_coefficients(
         self,
@@ -141,17 +181,14 @@ class ModelResults:
         ArrayLike
             Array with the estimated coefficients, alpha and beta.
         """
-        assert (
-            quantile,
-            penalty,
-            eta,
-        ) in self._models.keys(), (
-            "Model with the specified parameters is not estimated."
-        )
-        alpha = self._models[quantile, penalty, eta].get_alpha()
-        beta = self._models[quantile, penalty, eta].get_beta().flatten()
-        # join alpha in beta into one array
-        coefficients = (np.stack([alpha, beta], axis=0)).T
+        arrays = self._arrays((quantile, penalty, eta))
+        alpha = arrays["alpha"]
+        beta = arrays["beta"]
+        # Write alpha and beta into one preallocated C-contiguous buffer
+        # instead of stacking to (2, n) and transposing
+        coefficients = np.empty((alpha.size, 2), dtype=np.float64)
+        coefficients[:, 0] = alpha
+        coefficients[:, 1] = beta
         return coefficients
 
     def get_number_of_segments(
@@ -181,14 +218,10 @@ class ModelResults:
         int
             Number of segments in the estimated piecewise-linear function.
         """
-        assert (
-            quantile,
-            penalty,
-            eta,
-        ) in self._models.keys(), (
-            "Model with the specified parameters is not estimated."
-        )
-        return len(self._models[quantile, penalty, eta].get_alpha())
+        model = self._get((quantile, penalty, eta))
+        # len() of the Pyomo index set is O(1); get_alpha() would rebuild
+        # the whole coefficient array just to take its length
+        return len(model.__model__.I)
 
     def get_estimate(
         self,
@@ -217,31 +250,31 @@ class ModelResults:
         estimate : pd.DataFrame
             Estimated fundamental diagram values.
         """
-        assert (
-            quantile,
-            penalty,
-            eta,
-        ) in self._models.keys(), (
-            "Model with the specified parameters is not estimated."
-        )
-        x = np.array(self._models[quantile, penalty, eta].x).flatten().T
-        y = np.array(self._models[quantile, penalty, eta].y).T
-        y_hat = np.array(self._models[quantile, penalty, eta].get_frontier()).T
-        data = (np.stack([x, y, y_hat], axis=0)).T
-        data = data[np.argsort(data[:, 0])].T
-
-        x, y, f = data[0], data[1], data[2]
-        speed = y / x
-        speed_hat = y_hat / x
+        arrays = self._arrays((quantile, penalty, eta))
+        x = arrays["x"]
+        y = arrays["y"]
+        y_hat = arrays["frontier"]
+
+        # Sort by density through one index gather on each 1-D array
+        # instead of stacking an (n, 3) matrix, sorting and slicing it back
+        order = np.argsort(x, kind="stable")
+
+        # Write every column into one contiguous (n, 5) block; a
+        # dict-of-arrays DataFrame holds separate blocks that the
+        # BlockManager consolidates with an extra copy later
+        mat = np.empty((x.size, 5), dtype=np.float64)
+        mat[:, 0] = x[order]
+        mat[:, 1] = y[order]
+        mat[:, 2] = y_hat[order]
+        # One reciprocal and two multiplies instead of two divisions -
+        # division is several times slower per element
+        inv_x = np.reciprocal(mat[:, 0])
+        mat[:, 3] = mat[:, 1] * inv_x
+        mat[:, 4] = mat[:, 2] * inv_x
 
         estimate = pd.DataFrame(
-            {
-                "density": x,
-                "flow": y,
-                "flow_estimate": f,
-                "speed": speed,
-                "speed_estimate": speed_hat,
-            }
+            mat,
+            columns=["density", "flow", "flow_estimate", "speed", "speed_estimate"],
         )
         return estimate
 
@@ -273,167 +306,192 @@ class ModelResults:
             Status of the optimization problem.
 
         """
-        assert (
-            quantile,
-            penalty,
-            eta,
-        ) in self._models.keys(), (
-            "Model with the specified parameters is not estimated."
-        )
-        return self._models[quantile, penalty, eta].get_status()
+        return self._get((quantile, penalty, eta)).get_status()
 
 
-# Estimate CNLS model
-def _cnls(x: ArrayLike, y: ArrayLike, email: str) -> CNLS.CNLS:
-    start_time = time.perf_counter()
-    print("[LOG] Estimating the CNLS model...")
-    model = CNLS.CNLS(y=y, x=x, fun=FUN_PROD, cet=CET_ADDI, rts=RTS_VRS)
-    model.__model__.beta.setlb(None)
+# A single solver handle reused across local solves
+_SOLVER = None
+
+
+def _solve(model, email) -> None:
+    """Optimize `model`, reusing one local solver instance across calls.
+
+    pystoned's optimize() builds a fresh SolverFactory per solve, which
+    adds fixed setup and result-file overhead to every grid cell. Local
+    solves instead share a module-level handle with `tee=False`; NEOS
+    submissions (an email is given) keep going through pystoned.
+    """
+    global _SOLVER
     if email is not None:
         model.optimize(email)
-    else:
-        model.optimize()
-    end_time = time.perf_counter()
-    print(
-        f"[LOG] CNLS model was estimated in {end_time - start_time:.4f} seconds."  # noqa E501
+        return
+    if _SOLVER is None:
+        from pyomo.environ import SolverFactory
+
+        # Same default pystoned picks for additive models
+        _SOLVER = SolverFactory("mosek")
+    # Mirror the bookkeeping of pystoned's optimize(): the solve results
+    # land in problem_status and a local solve sets optimization_status=1
+    model.problem_status = _SOLVER.solve(model.__model__, tee=False)
+    model.optimization_status = 1
+
+
+# Seed a model with the solution of a previously solved one
+def _apply_warm_start(model, warm_start) -> None:
+    """Copy the primal variable values of `warm_start` into `model` so the
+    interior-point solver starts near the previous optimum.
+
+    Regularization and quantile paths are smooth: a small change in `eta`
+    or `tau` barely moves the solution, so seeding the variables cuts the
+    number of solver iterations substantially.
+    """
+    if warm_start is None:
+        return
+    source = warm_start.__model__
+    target = model.__model__
+    for name in ("alpha", "beta", "epsilon", "epsilon_plus", "epsilon_minus", "frontier"):  # noqa E501
+        source_var = getattr(source, name, None)
+        target_var = getattr(target, name, None)
+        if source_var is None or target_var is None:
+            continue
+        for index, variable in target_var.items():
+            value = source_var[index].value
+            if value is not None:
+                variable.value = value
+
+
+# (weighted, penalized, quantile regression) -> pystoned model class
+_MODEL_CLASSES = {
+    (False, False, False): CNLS.CNLS,
+    (False, True, False): pCNLS.pCNLS,
+    (True, False, False): wCNLS.wCNLS,
+    (True, True, False): pwCNLS.pwCNLS,
+    (False, False, True): CQER.CQR,
+    (False, True, True): pCQER.pCQR,
+    (True, False, True): wCQER.wCQR,
+    (True, True, True): pwCQER.pwCQR,
+}
+
+
+def _fit(
+    x: ArrayLike,
+    y: ArrayLike,
+    weight: typing.Optional[ArrayLike] = None,
+    quantile: typing.Optional[float] = None,
+    penalty: typing.Optional[str] = None,
+    eta: typing.Optional[float] = None,
+    email: str = None,
+    warm_start=None,
+):
+    """Build, warm-start and optimize one pystoned model.
+
+    The model class is picked from `_MODEL_CLASSES` by which optional
+    arguments are present: a `weight` selects the weighted variants, a
+    `quantile` the CQR family, a `penalty` the penalized ones. All eight
+    former wrapper bodies - input normalization, timing, the beta
+    lower-bound reset and the solve - live here once.
+    """
+    # Normalize inputs to contiguous float64 before the Pyomo build -
+    # pystoned iterates them while creating the n^2 Afriat constraints,
+    # and Python lists make that an interpreter loop
+    x = np.ascontiguousarray(np.asarray(x, dtype=np.float64))
+    y = np.ascontiguousarray(np.asarray(y, dtype=np.float64).ravel())
+    kwargs = dict(y=y, x=x, fun=FUN_PROD, cet=CET_ADDI, rts=RTS_VRS)
+    if weight is not None:
+        kwargs["w"] = np.ascontiguousarray(
+            np.asarray(weight, dtype=np.float64).ravel()
+        )
+    if quantile is not None:
+        kwargs["tau"] = quantile
+    if penalty is not None:
+        kwargs["penalty"] = int(penalty[-1])
+        kwargs["eta"] = eta
+
+    model_cls = _MODEL_CLASSES[
+        (weight is not None, penalty is not None, quantile is not None)
+    ]
+    timing = _log.isEnabledFor(logging.INFO)
+    start_time = time.perf_counter() if timing else 0.0
+    _log.info(
+        "[LOG] Estimating the %s model (quantile=%s, penalty=%s, eta=%s)...",
+        model_cls.__name__, quantile, penalty, eta,
     )
+    model = model_cls(**kwargs)
+    model.__model__.beta.setlb(None)
+    _apply_warm_start(model, warm_start)
+    _solve(model, email)
+    if timing:
+        _log.info(
+            "[LOG] %s model was estimated in %.4f seconds.",
+            model_cls.__name__, time.perf_counter() - start_time,
+        )
     return model
 
 
+# Estimate CNLS model
+def _cnls(x: ArrayLike, y: ArrayLike, email: str) -> CNLS.CNLS:
+    return _fit(x, y, email=email)
+
+
 # Estimate pCNLS model
 def _pcnls(
-    x: ArrayLike, y: ArrayLike, penalty: str, eta: float, email: str
+    x: ArrayLike,
+    y: ArrayLike,
+    penalty: str,
+    eta: float,
+    email: str,
+    warm_start: typing.Optional[pCNLS.pCNLS] = None,
 ) -> pCNLS.pCNLS:
-    start_time = time.perf_counter()
-    print(f"[LOG] Estimating the CNLS model with {penalty} penalty (eta={eta})...")
-    model = pCNLS.pCNLS(
-        y=y, x=x, fun=FUN_PROD, cet=CET_ADDI, rts=RTS_VRS, penalty=int(penalty[-1]), eta=eta
-    )
-    model.__model__.beta.setlb(None)
-    if email is not None:
-        model.optimize(email)
-    else:
-        model.optimize()
-    end_time = time.perf_counter()
-    print(
-        f"[LOG] CNLS model with {penalty} penalty (eta={eta}) was estimated in {end_time - start_time:.4f} seconds."  # noqa E501
-    )
-    return model
+    return _fit(x, y, penalty=penalty, eta=eta, email=email, warm_start=warm_start)
 
 
 # Estimate wCNLS model
 def _wcnls(x: ArrayLike, y: ArrayLike, weight: ArrayLike, email: str) -> wCNLS.wCNLS:
-    start_time = time.perf_counter()
-    print("[LOG] Estimating the weighted CNLS model...")
-    model = wCNLS.wCNLS(y=y, x=x, w=weight, fun=FUN_PROD, cet=CET_ADDI, rts=RTS_VRS)
-    model.__model__.beta.setlb(None)
-    if email is not None:
-        model.optimize(email)
-    else:
-        model.optimize()
-    end_time = time.perf_counter()
-    print(
-        f"[LOG] weighted CNLS model was estimated in {end_time - start_time:.4f} seconds."  # noqa E501
-    )
-    return model
+    return _fit(x, y, weight=weight, email=email)
 
 
 # Estimate pwCNLS model
 def _pwcnls(
-    x: ArrayLike, y: ArrayLike, weight: ArrayLike, penalty: str, eta: float, email: str
+    x: ArrayLike,
+    y: ArrayLike,
+    weight: ArrayLike,
+    penalty: str,
+    eta: float,
+    email: str,
+    warm_start: typing.Optional[pwCNLS.pwCNLS] = None,
 ) -> pwCNLS.pwCNLS:
-    start_time = time.perf_counter()
-    print(
-        f"[LOG] Estimating the weighted CNLS model with {penalty} penalty and eta={eta}..."
-    )
-    model = pwCNLS.pwCNLS(
-        y=y,
-        x=x,
-        w=weight,
-        fun=FUN_PROD,
-        cet=CET_ADDI,
-        rts=RTS_VRS,
-        penalty=int(penalty[-1]),
-        eta=eta,
-    )
-    model.__model__.beta.setlb(None)
-    if email is not None:
-        model.optimize(email)
-    else:
-        model.optimize()
-    end_time = time.perf_counter()
-    print(
-        f"[LOG] weighted CNLS model with {penalty} penalty (eta={eta}) was estimated in {end_time - start_time:.4f} seconds."  # noqa E501
+    return _fit(
+        x, y, weight=weight, penalty=penalty, eta=eta, email=email,
+        warm_start=warm_start,
     )
-    return model
 
 
 # Estimate CQR model
 def _cqr(x: ArrayLike, y: ArrayLike, quantile: float, email: str) -> CQER.CQR:
-    start_time = time.perf_counter()
-    print(f"[LOG] Estimating the CQR model for quantile={quantile}...")
-    model = CQER.CQR(y=y, x=x, tau=quantile, fun=FUN_PROD, cet=CET_ADDI, rts=RTS_VRS)
-    model.__model__.beta.setlb(None)
-    if email is not None:
-        model.optimize(email)
-    else:
-        model.optimize()
-    end_time = time.perf_counter()
-    print(
-        f"[LOG] CQR model for quantile={quantile} was estimated in {end_time - start_time:.4f} seconds."  # noqa E501
-    )
-    return model
+    return _fit(x, y, quantile=quantile, email=email)
 
 
 # Estimate pCQR model
 def _pcqr(
-    x: ArrayLike, y: ArrayLike, quantile: float, penalty: str, eta: float, email: str
+    x: ArrayLike,
+    y: ArrayLike,
+    quantile: float,
+    penalty: str,
+    eta: float,
+    email: str,
+    warm_start: typing.Optional[pCQER.pCQR] = None,
 ) -> pCQER.pCQR:
-    start_time = time.perf_counter()
-    print(
-        f"[LOG] Estimating the CQR model for quantile={quantile} with {penalty} penalty (eta={eta})..."
-    )
-    model = pCQER.pCQR(
-        y=y,
-        x=x,
-        tau=quantile,
-        fun=FUN_PROD,
-        cet=CET_ADDI,
-        rts=RTS_VRS,
-        penalty=int(penalty[-1]),
-        eta=eta,
-    )
-    model.__model__.beta.setlb(None)
-    if email is not None:
-        model.optimize(email)
-    else:
-        model.optimize()
-    end_time = time.perf_counter()
-    print(
-        f"[LOG] CQR model for quantile={quantile} with {penalty} penalty (eta={eta}) was estimated in {end_time - start_time:.4f} seconds."  # noqa E501
+    return _fit(
+        x, y, quantile=quantile, penalty=penalty, eta=eta, email=email,
+        warm_start=warm_start,
     )
-    return model
 
 
 # Estimate wCQR model
 def _wcqr(
     x: ArrayLike, y: ArrayLike, weight: ArrayLike, quantile: float, email: str
 ) -> wCQER.wCQR:
-    start_time = time.perf_counter()
-    print(f"[LOG] Estimating the weighted CQR model for quantile={quantile}...")
-    model = wCQER.wCQR(
-        y=y, x=x, w=weight, tau=quantile, fun=FUN_PROD, cet=CET_ADDI, rts=RTS_VRS
-    )
-    model.__model__.beta.setlb(None)
-    if email is not None:
-        model.optimize(email)
-    else:
-        model.optimize()
-    end_time = time.perf_counter()
-    print(
-        f"[LOG] weighted CQR model for quantile={quantile} was estimated in {end_time - start_time:.4f} seconds."  # noqa E501
-    )
-    return model
+    return _fit(x, y, weight=weight, quantile=quantile, email=email)
 
 
 # Estimate pwCQR model
@@ -445,29 +503,176 @@ def _pwcqr(
     penalty: str,
     eta: float,
     email: str,
+    warm_start: typing.Optional[pwCQER.pwCQR] = None,
 ) -> pwCQER.pwCQR:
-    start_time = time.perf_counter()
-    print(
-        f"[LOG] Estimating the weighted CQR model for quantile={quantile} with {penalty} penalty (eta={eta})..."
+    return _fit(
+        x, y, weight=weight, quantile=quantile, penalty=penalty, eta=eta,
+        email=email, warm_start=warm_start,
     )
-    model = pwCQER.pwCQR(
-        y=y,
-        x=x,
-        w=weight,
-        tau=quantile,
-        fun=FUN_PROD,
-        cet=CET_ADDI,
-        rts=RTS_VRS,
-        penalty=int(penalty[-1]),
-        eta=eta,
+
+
+# Estimate one grid point in a worker process
+def _estimate_one(
+    x: ArrayLike,
+    y: ArrayLike,
+    weight: typing.Union[None, ArrayLike],
+    quantile: typing.Union[str, float],
+    penalty: typing.Union[None, str],
+    eta: typing.Union[None, float],
+    email: str,
+):
+    if quantile == "mean":
+        if weight is None:
+            if penalty is None:
+                return _cnls(x=x, y=y, email=email)
+            return _pcnls(x=x, y=y, penalty=penalty, eta=eta, email=email)
+        if penalty is None:
+            return _wcnls(x=x, y=y, weight=weight, email=email)
+        return _pwcnls(x=x, y=y, weight=weight, penalty=penalty, eta=eta, email=email)
+    if weight is None:
+        if penalty is None:
+            return _cqr(x=x, y=y, quantile=quantile, email=email)
+        return _pcqr(x=x, y=y, quantile=quantile, penalty=penalty, eta=eta, email=email)
+    if penalty is None:
+        return _wcqr(x=x, y=y, weight=weight, quantile=quantile, email=email)
+    return _pwcqr(
+        x=x, y=y, weight=weight, quantile=quantile, penalty=penalty, eta=eta, email=email
     )
-    model.__model__.beta.setlb(None)
-    if email is not None:
-        model.optimize(email)
-    else:
-        model.optimize()
-    end_time = time.perf_counter()
-    print(
-        f"[LOG] weighted CQR model for quantile={quantile} with {penalty} penalty (eta={eta}) was estimated in {end_time - start_time:.4f} seconds."  # noqa E501
+
+
+def estimate_grid(
+    x: ArrayLike,
+    y: ArrayLike,
+    quantiles: typing.Optional[list] = None,
+    penalties: typing.Optional[list] = None,
+    etas: typing.Optional[list] = None,
+    weight: typing.Optional[ArrayLike] = None,
+    email: str = None,
+    n_workers: typing.Optional[int] = None,
+) -> ModelResults:
+    """Estimate a grid of models in parallel and collect them into a single
+    :class:`ModelResults`.
+
+    Each `(quantile, penalty, eta)` combination is an independent QP solve
+    with no shared state, so the grid points are submitted to a
+    `concurrent.futures.ProcessPoolExecutor` and solved on separate cores.
+
+    Parameters
+    ----------
+    x : ArrayLike
+        Input (density) values.
+    y : ArrayLike
+        Output (flow) values.
+    quantiles : list, optional
+        Quantiles to estimate; the entry `'mean'` selects the CNLS model,
+        by default `['mean']`
+    penalties : list, optional
+        Penalty types to sweep, each `None`, `'l1'`, `'l2'` or `'l3'`,
+        by default `[None]`
+    etas : list, optional
+        Values of the tuning parameter, swept for every non-None penalty,
+        by default None
+    weight : ArrayLike, optional
+        Observation weights; selects the weighted model variants, by default None
+    email : str, optional
+        For external optimization on the NEOS server, by default None
+    n_workers : int, optional
+        Number of worker processes, by default `os.cpu_count()`
+
+    Raises
+    ------
+    AssertionError
+        etas must be a non-empty list if a penalty is selected.
+
+    Returns
+    -------
+    ModelResults
+        Estimated models for all grid points.
+    """
+    if quantiles is None:
+        quantiles = ["mean"]
+    if penalties is None:
+        penalties = [None]
+
+    jobs = []
+    for penalty in penalties:
+        if penalty is None:
+            eta_values: list = [None]
+        else:
+            assert (
+                etas is not None and len(etas) > 0
+            ), "[LOG] AssertionError: etas must be a non-empty list if a penalty is selected."  # noqa E501
+            eta_values = etas
+        for eta in eta_values:
+            for quantile in quantiles:
+                jobs.append((quantile, penalty, eta))
+
+    results = ModelResults()
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=n_workers if n_workers is not None else os.cpu_count()
+    ) as executor:
+        futures = {
+            executor.submit(_estimate_one, x, y, weight, quantile, penalty, eta, email): (
+                quantile,
+                penalty,
+                eta,
+            )
+            for (quantile, penalty, eta) in jobs
+        }
+        for future in concurrent.futures.as_completed(futures):
+            quantile, penalty, eta = futures[future]
+            results._add_model(future.result(), quantile, penalty, eta)
+    return results
+
+
+def fit_quantiles(
+    x: ArrayLike,
+    y: ArrayLike,
+    quantiles: list,
+    weight: typing.Optional[ArrayLike] = None,
+    penalty: typing.Optional[str] = None,
+    eta: typing.Optional[float] = None,
+    email: str = None,
+    n_workers: typing.Optional[int] = None,
+) -> ModelResults:
+    """Fit independent CQR models for several quantiles in parallel.
+
+    Convenience front end to :func:`estimate_grid` for the most common
+    sweep - many quantiles of one model family. Each fit builds its own
+    Pyomo model inside a worker process, so the solves run on separate
+    cores.
+
+    Parameters
+    ----------
+    x : ArrayLike
+        Input (density) values.
+    y : ArrayLike
+        Output (flow) values.
+    quantiles : list
+        Quantiles to estimate.
+    weight : ArrayLike, optional
+        Observation weights; selects the weighted model variants, by default None
+    penalty : str, optional
+        Penalty type, `None`, `'l1'`, `'l2'` or `'l3'`, by default None
+    eta : float, optional
+        Value of the tuning parameter for a non-None penalty, by default None
+    email : str, optional
+        For external optimization on the NEOS server, by default None
+    n_workers : int, optional
+        Number of worker processes, by default `os.cpu_count()`
+
+    Returns
+    -------
+    ModelResults
+        Estimated models for all quantiles.
+    """
+    return estimate_grid(
+        x,
+        y,
+        quantiles=list(quantiles),
+        penalties=[penalty],
+        etas=None if eta is None else [eta],
+        weight=weight,
+        email=email,
+        n_workers=n_workers,
     )
-    return model
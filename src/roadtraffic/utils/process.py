@@ -1,11 +1,62 @@
 import pandas as pd
 import numpy as np
 from typing import Sequence
-import scipy
 import time
 
 from .constants import DEF_AGG_TIME_PER
 
+try:  # numba is an optional accelerator - everything falls back to NumPy
+    import numba
+except ImportError:
+    numba = None
+
+if numba is not None:
+
+    @numba.njit(cache=True, fastmath=True)
+    def _hmean_by_group(codes, speeds, n_groups):  # pragma: no cover - jitted
+        """Reciprocal sum and count per group code in one fused pass."""
+        inv_sum = np.zeros(n_groups, dtype=np.float64)
+        cnt = np.zeros(n_groups, dtype=np.int64)
+        for i in range(codes.shape[0]):
+            g = codes[i]
+            inv_sum[g] += 1.0 / speeds[i]
+            cnt[g] += 1
+        return inv_sum, cnt
+
+    @numba.njit(cache=True, parallel=True)
+    def _window_sums(tt, starts, stops, begins, ends, c_inv, c_cars, c_buses, c_trucks):  # pragma: no cover - jitted # noqa E501
+        """Per-(segment, window) reductions from the prefix sums."""
+        n_win = begins.shape[0]
+        n_rows = starts.shape[0] * n_win
+        cnt = np.empty(n_rows, dtype=np.int64)
+        inv_sum = np.empty(n_rows)
+        cars = np.empty(n_rows)
+        buses = np.empty(n_rows)
+        trucks = np.empty(n_rows)
+        for r in numba.prange(n_rows):
+            s = r // n_win
+            w = r % n_win
+            seg = tt[starts[s]:stops[s]]
+            lo = starts[s] + np.searchsorted(seg, begins[w])
+            hi = starts[s] + np.searchsorted(seg, ends[w])
+            cnt[r] = hi - lo
+            inv_sum[r] = c_inv[hi] - c_inv[lo]
+            cars[r] = c_cars[hi] - c_cars[lo]
+            buses[r] = c_buses[hi] - c_buses[lo]
+            trucks[r] = c_trucks[hi] - c_trucks[lo]
+        return cnt, inv_sum, cars, buses, trucks
+
+    @numba.njit(cache=True, parallel=True, fastmath=True)
+    def _representor_kernel(alpha, beta, x, out):  # pragma: no cover - jitted
+        """Fused min over segments without the (K, N) intermediate."""
+        for i in numba.prange(x.shape[0]):
+            g_min = alpha[0] + beta[0] * x[i]
+            for k in range(1, alpha.shape[0]):
+                g = alpha[k] + beta[k] * x[i]
+                if g < g_min:
+                    g_min = g
+            out[i] = g_min
+
 
 def aggregate(
     data: pd.DataFrame,
@@ -16,47 +67,112 @@ def aggregate(
     assert aggregation_time_period_unit in ["min", "sec"], "[LOG]: AssertionError: Wrong aggregation time period unit." # noqa E501
     start_time = time.perf_counter()
 
-    # Copy initial data set to calculate aggregation periods for a selected direction
-    df = data.copy(deep=True)
+    # The derived columns are computed as NumPy arrays and attached with
+    # assign, so the caller's frame is never touched and the full-table
+    # deep copy disappears. Widen before scaling - the raw columns are
+    # int8 and hour * 60 would overflow in the narrow dtype
+    hour = data["hour"].to_numpy(dtype=np.int32)
+    minute = data["minute"].to_numpy(dtype=np.int32)
     if aggregation_time_period_unit == "min":
-        df["aggregation"] = (df["hour"] * 60 + df["minute"]) / aggregation_time_period
+        aggregation = (hour * 60 + minute) // int(aggregation_time_period)
     if aggregation_time_period_unit == "sec":
-        df["aggregation"] = (
-            df["hour"] * 60 * 60 + df["minute"] * 60 + df["second"]
-        ) / aggregation_time_period
-    df = df.astype({"aggregation": int})
+        second = data["second"].to_numpy(dtype=np.int32)
+        aggregation = (hour * 60 * 60 + minute * 60 + second) // int(
+            aggregation_time_period
+        )
+
+    df = data.assign(aggregation=aggregation)
+    # Frames from load.py already carry these compact dtypes; re-assert
+    # them so externally built frames move half the bytes through the
+    # bandwidth-bound group reductions too
+    df = df.astype(
+        {"cars": "int8", "buses": "int8", "trucks": "int8", "speed": "float32"},
+        copy=False,
+    )
 
     # Aggregate flow and speed by time
     if by_lane:
-        agg_data = df.groupby(
-            ["id", "date", "aggregation", "direction", "lane"], as_index=False
-        ).agg(
-            period_speed=("speed", scipy.stats.hmean),
-            period_flow=("cars", "count"),
-            period_cars=("cars", "sum"),
-            period_buses=("buses", "sum"),
-            period_trucks=("trucks", "sum"),
-        )
+        keys = ["id", "date", "aggregation", "direction", "lane"]
     else:
-        agg_data = df.groupby(
-            ["id", "date", "aggregation", "direction"], as_index=False
-        ).agg(
-            period_speed=("speed", scipy.stats.hmean),
-            period_flow=("cars", "count"),
-            period_cars=("cars", "sum"),
-            period_buses=("buses", "sum"),
-            period_trucks=("trucks", "sum"),
+        keys = ["id", "date", "aggregation", "direction"]
+    # The composite key is packed into one uint64 so the groupby hashes a
+    # single integer per row instead of a tuple of key columns; the key
+    # columns are rebuilt afterwards from each group's first row. Bit
+    # budget: lane 4, direction 4, aggregation 20 (one-second buckets go
+    # up to 86399), date 16, id 20
+    id_codes = pd.factorize(df["id"].to_numpy())[0].astype(np.uint64)
+    date_codes = pd.factorize(df["date"].to_numpy())[0].astype(np.uint64)
+    packed = (
+        (id_codes << np.uint64(44))
+        | (date_codes << np.uint64(28))
+        | (aggregation.astype(np.uint64) << np.uint64(8))
+        | (df["direction"].to_numpy(dtype=np.uint64) << np.uint64(4))
+    )
+    if by_lane:
+        packed |= df["lane"].to_numpy(dtype=np.uint64)
+    # factorize numbers the groups in order of first appearance, so row i
+    # of the sort=False aggregation result is exactly group code i
+    codes = pd.factorize(packed)[0]
+    first_rows = np.unique(codes, return_index=True)[1]
+
+    agg_counts = dict(
+        period_flow=("cars", "count"),
+        period_cars=("cars", "sum"),
+        period_buses=("buses", "sum"),
+        period_trucks=("trucks", "sum"),
+    )
+    # Harmonic mean = count / sum(1/x). With numba the reciprocal sum and
+    # count run in one fused pass over the group codes; the fallback adds
+    # an inv_speed column and lets the groupby sum it
+    if numba is not None:
+        grouped = df.groupby(codes, sort=False)
+        agg_data = grouped.agg(**agg_counts).reset_index(drop=True)
+        inv_sum, cnt = _hmean_by_group(
+            codes, df["speed"].to_numpy(dtype=np.float64), len(agg_data)
         )
+        agg_data["period_speed"] = cnt / inv_sum
+    else:
+        df["inv_speed"] = 1.0 / df["speed"].to_numpy()
+        grouped = df.groupby(codes, sort=False)
+        agg_data = grouped.agg(
+            inv_speed_sum=("inv_speed", "sum"), **agg_counts
+        ).reset_index(drop=True)
+        inv_sum = agg_data["inv_speed_sum"].to_numpy()
+        agg_data["period_speed"] = agg_data["period_flow"].to_numpy() / inv_sum
+        agg_data = agg_data.drop(columns="inv_speed_sum")
+    for pos, c in enumerate(keys):
+        agg_data.insert(pos, c, df[c].to_numpy()[first_rows])
 
-    agg_data["flow"] = 60 / aggregation_time_period * agg_data["period_flow"]
-    agg_data["cars"] = 60 / aggregation_time_period * agg_data["period_cars"]
-    agg_data["buses"] = 60 / aggregation_time_period * agg_data["period_buses"]
-    agg_data["trucks"] = 60 / aggregation_time_period * agg_data["period_trucks"]
-    agg_data["density"] = agg_data["flow"].div(agg_data["period_speed"].values)
+    # One vectorized multiply scales all four count columns to hourly
+    # rates instead of four separate column expressions
+    scale = 60 / aggregation_time_period
+    agg_data[["flow", "cars", "buses", "trucks"]] = (
+        agg_data[
+            ["period_flow", "period_cars", "period_buses", "period_trucks"]
+        ].to_numpy(dtype=np.float64)
+        * scale
+    )
+    # flow / period_speed simplifies to scale * sum(1/speed): the counts
+    # cancel, so density costs one multiply instead of a float division
+    agg_data["density"] = scale * inv_sum
     agg_data["seconds"] = agg_data["aggregation"] * 60 * aggregation_time_period
     agg_data["seconds"] = agg_data["seconds"].astype("float64")
-    agg_data["time"] = pd.to_datetime(agg_data["seconds"], unit="s")
-    agg_data["time"] = pd.Series([val.strftime("%H:%M") for val in agg_data["time"]])
+    # HH:MM comes straight from the bucket index with integer arithmetic -
+    # no datetime64 tensor and no strftime parsing (the % 24 mirrors the
+    # day wraparound strftime applied to large second counts). np.char
+    # rejects zero-size arrays, so an empty frame gets the column directly
+    if len(agg_data):
+        mins_total = (
+            agg_data["aggregation"].to_numpy(dtype=np.int64) * aggregation_time_period
+        )
+        hh = (mins_total // 60) % 24
+        mm = mins_total % 60
+        agg_data["time"] = np.char.add(
+            np.char.add(np.char.zfill(hh.astype("U2"), 2), ":"),
+            np.char.zfill(mm.astype("U2"), 2),
+        )
+    else:
+        agg_data["time"] = np.empty(0, dtype="U5")
 
     end_time = time.perf_counter()
 
@@ -92,26 +208,53 @@ def bagging(
     max_density = agg_data["density"].max()
     max_flow = agg_data["flow"].max()
 
-    # Calculating the size of the bag
-    grid_density_size = max_density / grid_size_x
-    grid_flow_size = max_flow / grid_size_y
-
-    # Assigning the bag number for density and
-    agg_data["grid_density"] = agg_data["density"] / grid_density_size
-    agg_data["grid_flow"] = agg_data["flow"] / grid_flow_size
-    agg_data = agg_data.astype({"grid_density": int, "grid_flow": int})
-
-    # Calculating the centroid and the weight of each bag
-    bag_data = agg_data.groupby(
-        ["id", "direction", "grid_density", "grid_flow"], as_index=False
-    ).agg(
-        bag_size=("id", "count"),
-        sum_flow=("flow", "sum"),
-        sum_density=("density", "sum"),
+    # Assigning the bag number for density and flow in one multiply+cast
+    # pass per column - no float division column plus astype round-trip
+    agg_data["grid_density"] = (
+        agg_data["density"].to_numpy() * (grid_size_x / max_density)
+    ).astype(np.int32)
+    agg_data["grid_flow"] = (
+        agg_data["flow"].to_numpy() * (grid_size_y / max_flow)
+    ).astype(np.int32)
+
+    # Calculating the centroid and the weight of each bag. The four keys
+    # are packed into one uint64 (as in aggregate) and the reductions run
+    # through np.bincount - a dense C histogram with no hash table or
+    # groupby machinery. Bit budget: grid_flow 18, grid_density 18,
+    # direction 4, id 24
+    gd = agg_data["grid_density"].to_numpy()
+    gf = agg_data["grid_flow"].to_numpy()
+    id_codes = pd.factorize(agg_data["id"].to_numpy())[0].astype(np.uint64)
+    packed = (
+        (id_codes << np.uint64(40))
+        | (agg_data["direction"].to_numpy(dtype=np.uint64) << np.uint64(36))
+        | (gd.astype(np.uint64) << np.uint64(18))
+        | gf.astype(np.uint64)
+    )
+    codes = pd.factorize(packed)[0]
+    first_rows = np.unique(codes, return_index=True)[1]
+    n_bags = first_rows.size
+    bag_size = np.bincount(codes, minlength=n_bags)
+    sum_flow = np.bincount(
+        codes, weights=agg_data["flow"].to_numpy(dtype=np.float64), minlength=n_bags
+    )
+    sum_density = np.bincount(
+        codes, weights=agg_data["density"].to_numpy(dtype=np.float64), minlength=n_bags
+    )
+    bag_data = pd.DataFrame(
+        {
+            "id": agg_data["id"].to_numpy()[first_rows],
+            "direction": agg_data["direction"].to_numpy()[first_rows],
+            "grid_density": gd[first_rows],
+            "grid_flow": gf[first_rows],
+            "bag_size": bag_size,
+            "sum_flow": sum_flow,
+            "sum_density": sum_density,
+        }
     )
-    bag_data["centroid_flow"] = bag_data["sum_flow"].div(bag_data["bag_size"])
-    bag_data["centroid_density"] = bag_data["sum_density"].div(bag_data["bag_size"])
-    bag_data["weight"] = bag_data["bag_size"].div(len(agg_data))
+    bag_data["centroid_flow"] = sum_flow / bag_size
+    bag_data["centroid_density"] = sum_density / bag_size
+    bag_data["weight"] = bag_size / len(agg_data)
     size_after = len(bag_data)
 
     end_time = time.perf_counter()
@@ -122,6 +265,189 @@ def bagging(
     return bag_data
 
 
+def rolling_window(
+    data: pd.DataFrame,
+    window_size: int = 5,
+    window_gap: int = 1,
+    hour_from: int = 0,
+    hour_to: int = 23,
+) -> pd.DataFrame:
+    """
+    Aggregate processed data over rolling time windows per lane.
+
+    Windows of `window_size` minutes start every `window_gap` minutes
+    between `hour_from` and `hour_to` (inclusive). The data is sorted
+    once by (year, day, lane, total_time); every window then becomes a
+    searchsorted slice into the sorted arrays and all window sums are
+    prefix-sum differences, so the runtime is O(N log N + W) instead of
+    one full scan of the frame per window.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        Processed dataframe, see :func:`~roadtraffic.utils.load.process_data`
+    window_size : int, optional
+        Length of the rolling window in minutes, by default 5
+    window_gap : int, optional
+        Gap between consecutive window starts in minutes, by default 1
+    hour_from : int, optional
+        Hour to start the first window at, by default 0
+    hour_to : int, optional
+        Hour the last window must end by (inclusive), by default 23
+
+    Returns
+    -------
+    pd.DataFrame
+        pd.DataFrame with one row per (year, day, lane, window)
+    """
+    start_time = time.perf_counter()
+
+    # total_time is measured in hundredths of a second since midnight
+    win = window_size * 60 * 100
+    gap = window_gap * 60 * 100
+    begins = np.arange(
+        hour_from * 360000, (hour_to + 1) * 360000 - win + 1, gap, dtype=np.int64
+    )
+    ends = begins + win
+
+    tt = data["total_time"].to_numpy(dtype=np.int64)
+    # Degenerate shapes - no input rows, or no window fits between
+    # hour_from and hour_to - short-circuit to an empty frame with the
+    # output columns in place
+    if tt.size == 0 or begins.size == 0:
+        empty_i = np.empty(0, dtype=np.int64)
+        empty_f = np.empty(0)
+        end_time = time.perf_counter()
+        print(f"Rolling window aggregation took {end_time-start_time:.4f} seconds")
+        return pd.DataFrame(
+            {
+                "year": empty_i,
+                "day": empty_i,
+                "lane": empty_i,
+                "begin_time": empty_i,
+                "end_time": empty_i,
+                "time": np.empty(0, dtype="U8"),
+                "flow": empty_f,
+                "density": empty_f,
+                "hmean_speed": empty_f,
+                "hmean_speed_all_lanes": empty_f,
+                "cars": empty_f,
+                "buses": empty_f,
+                "trucks": empty_f,
+            }
+        )
+
+    # One lexsort puts every (year, day, lane) segment into contiguous,
+    # time-sorted runs; the per-window masks of the naive version become
+    # binary searches into these runs
+    year = data["year"].to_numpy(dtype=np.int64)
+    day = data["day"].to_numpy(dtype=np.int64)
+    lane = data["lane"].to_numpy(dtype=np.int64)
+    order = np.lexsort((tt, lane, day, year))
+    tt = tt[order]
+    year = year[order]
+    day = day[order]
+    lane = lane[order]
+
+    n = tt.size
+    change = np.flatnonzero(
+        (year[1:] != year[:-1]) | (day[1:] != day[:-1]) | (lane[1:] != lane[:-1])
+    )
+    starts = np.concatenate(([0], change + 1))
+    stops = np.concatenate((change + 1, [n]))
+    n_seg = starts.size
+    n_win = begins.size
+
+    # Prefix sums (with a leading zero) turn every window reduction into
+    # two gathers and a subtract; lo/hi never cross a segment boundary,
+    # so the running totals may span segments
+    speed = data["speed"].to_numpy(dtype=np.float64)[order]
+    inv_speed = np.reciprocal(speed)
+    zero = np.zeros(1)
+    c_inv = np.concatenate((zero, np.cumsum(inv_speed)))
+    c_cars = np.concatenate((zero, np.cumsum(data["cars"].to_numpy(dtype=np.float64)[order])))  # noqa E501
+    c_buses = np.concatenate((zero, np.cumsum(data["buses"].to_numpy(dtype=np.float64)[order])))  # noqa E501
+    c_trucks = np.concatenate((zero, np.cumsum(data["trucks"].to_numpy(dtype=np.float64)[order])))  # noqa E501
+
+    # With numba the (segment, window) reductions run as one parallel
+    # kernel; the fallback loops over segments with the windows of each
+    # segment handled as vectorized searchsorted batches
+    if numba is not None:
+        cnt, inv_sum, cars, buses, trucks = _window_sums(
+            tt, starts, stops, begins, ends, c_inv, c_cars, c_buses, c_trucks
+        )
+    else:
+        n_rows = n_seg * n_win
+        cnt = np.empty(n_rows, dtype=np.int64)
+        inv_sum = np.empty(n_rows)
+        cars = np.empty(n_rows)
+        buses = np.empty(n_rows)
+        trucks = np.empty(n_rows)
+        for s in range(n_seg):
+            lo = starts[s] + np.searchsorted(tt[starts[s]:stops[s]], begins)
+            hi = starts[s] + np.searchsorted(tt[starts[s]:stops[s]], ends)
+            row = slice(s * n_win, (s + 1) * n_win)
+            cnt[row] = hi - lo
+            inv_sum[row] = c_inv[hi] - c_inv[lo]
+            cars[row] = c_cars[hi] - c_cars[lo]
+            buses[row] = c_buses[hi] - c_buses[lo]
+            trucks[row] = c_trucks[hi] - c_trucks[lo]
+
+    # The all-lane harmonic mean of a window is the same reduction summed
+    # over every lane of the same (year, day): no second pass over the
+    # raw rows is needed
+    day_id = np.unique(
+        np.stack((year[starts], day[starts]), axis=1), axis=0, return_inverse=True
+    )[1]
+    bucket = np.repeat(day_id, n_win) * n_win + np.tile(np.arange(n_win), n_seg)
+    n_buckets = (day_id.max() + 1) * n_win
+    tot_cnt = np.bincount(bucket, weights=cnt, minlength=n_buckets)
+    tot_inv = np.bincount(bucket, weights=inv_sum, minlength=n_buckets)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        hmean_speed = cnt / inv_sum
+        hmean_all = tot_cnt[bucket] / tot_inv[bucket]
+        flow = cnt * (60.0 / window_size)
+        density = flow / hmean_speed
+
+    # HH:MM:SS of the window end, formatted once per window with integer
+    # arithmetic (as in aggregate) and tiled over the segments - no
+    # Timestamp objects, no per-row strftime
+    secs = ends // 100
+    hh = (secs // 3600) % 24
+    mm = (secs // 60) % 60
+    ss = secs % 60
+    time_str = np.char.add(
+        np.char.add(np.char.zfill(hh.astype("U2"), 2), ":"),
+        np.char.add(
+            np.char.add(np.char.zfill(mm.astype("U2"), 2), ":"),
+            np.char.zfill(ss.astype("U2"), 2),
+        ),
+    )
+
+    rolling_data = pd.DataFrame(
+        {
+            "year": np.repeat(year[starts], n_win),
+            "day": np.repeat(day[starts], n_win),
+            "lane": np.repeat(lane[starts], n_win),
+            "begin_time": np.tile(begins, n_seg),
+            "end_time": np.tile(ends, n_seg),
+            "time": np.tile(time_str, n_seg),
+            "flow": flow,
+            "density": density,
+            "hmean_speed": hmean_speed,
+            "hmean_speed_all_lanes": hmean_all,
+            "cars": cars,
+            "buses": buses,
+            "trucks": trucks,
+        }
+    )
+
+    end_time = time.perf_counter()
+    print(f"Rolling window aggregation took {end_time-start_time:.4f} seconds")
+    return rolling_data
+
+
 def representor(
     alpha: Sequence[float], beta: Sequence[float], x: Sequence[float]
 ) -> Sequence[float]:  # noqa E501
@@ -141,11 +467,28 @@ def representor(
     ArrayLike[float]
         The minimum value of g_hat for each x
     """
+    alpha = np.ascontiguousarray(np.asarray(alpha, dtype=np.float64).ravel())
+    beta = np.ascontiguousarray(np.asarray(beta, dtype=np.float64).ravel())
+    x = np.ascontiguousarray(np.asarray(x, dtype=np.float64).ravel())
+
+    g_hat_min = np.empty_like(x)
+    if numba is not None:
+        _representor_kernel(alpha, beta, x, g_hat_min)
+        return g_hat_min
+
+    # Fallback: tile over x so the full (K, N) matrix of
+    # alpha_k + beta_k * x_i is never materialized at once. The chunk
+    # buffer is allocated once and every op writes into it in place, so
+    # each tile costs one pass over (K, chunk) bytes instead of three
     alpha_r = alpha.reshape(-1, 1)
     beta_r = beta.reshape(-1, 1)
-    x_t = x.reshape(1, -1)
-    mult = np.matmul(beta_r, x_t)
-    mult_a = alpha_r + mult
-    g_hat_min = mult_a.min(axis=0)
+    chunk = 4096
+    buf = np.empty((alpha.size, min(chunk, x.size)))
+    for start in range(0, x.size, chunk):
+        x_t = x[start:start + chunk].reshape(1, -1)
+        out = buf[:, : x_t.shape[1]]
+        np.multiply(beta_r, x_t, out=out)
+        np.add(out, alpha_r, out=out)
+        out.min(axis=0, out=g_hat_min[start:start + chunk])
 
     return g_hat_min
@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+
+from roadtraffic.utils import load
+
+
+def _compact_frame() -> pd.DataFrame:
+    # Same compact dtypes that read_raw_report / _downcast_columns produce
+    df = pd.DataFrame(
+        {
+            "id": [146, 146, 146, 146],
+            "year": [23, 23, 23, 23],
+            "day": [270, 270, 271, 271],
+            "hour": [6, 7, 8, 23],
+            "minute": [0, 15, 30, 45],
+            "second": [0, 1, 2, 3],
+            "hund_second": [0, 0, 0, 0],
+            "length": [4.5, 12.0, 7.5, 4.2],
+            "lane": [1, 2, 1, 3],
+            "direction": [1, 1, 2, 1],
+            "vehicle": [1, 3, 2, 1],
+            "speed": [80.0, 75.5, 90.0, 100.0],
+            "faulty": [0, 0, 0, 1],
+            "total_time": [2160000, 2610100, 3060200, 8553300],
+            "time_interval": [0, 0, 0, 0],
+            "queue_start": [0, 0, 0, 0],
+        }
+    )
+    return load._downcast_columns(df)
+
+
+def test_process_data_compact_dtypes():
+    df = _compact_frame()
+    assert df["year"].dtype == np.int16 and df["day"].dtype == np.int16
+
+    processed = load.process_data(df, direction=1)
+
+    # int16 year/day must not overflow when building %Y%j dates
+    assert list(processed["date"]) == [
+        pd.Timestamp(2023, 9, 27),
+        pd.Timestamp(2023, 9, 27),
+    ]
+    assert list(processed["cars"]) == [1, 0]
+    assert list(processed["buses"]) == [0, 1]
+    assert list(processed["trucks"]) == [0, 0]